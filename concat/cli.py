@@ -8,6 +8,16 @@ import sys
 from . import __version__ as CONCAT_VERSION
 from . import combine
 
+def positive_int(value: str) -> int:
+    try:
+        n = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected a positive integer, got '{value}'")
+    if n < 1:
+        raise argparse.ArgumentTypeError(f"expected a positive integer, got {n}")
+    return n
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         prog="concat",
@@ -58,10 +68,25 @@ def build_parser() -> argparse.ArgumentParser:
         default=50,
         help="Rows to sample for delimiter sniffing and header peek (default: 50).",
     )
+    p_comb.add_argument(
+        "--delim",
+        choices=list(combine.SUPPORTED_DELIMS.keys()),
+        default=None,
+        help="Input delimiter shared by all files; skips delimiter sniffing.",
+    )
     p_comb.add_argument(
         "--normalize",
         choices=list(combine.SUPPORTED_DELIMS.keys()),
-        help="If delimiters are inconsistent, convert inputs to this delimiter in a temp workspace.",
+        help=(
+            "If delimiters are inconsistent, convert inputs to this delimiter in a temp "
+            "workspace before combining. Optional: mixed delimiters are otherwise read per file."
+        ),
+    )
+    p_comb.add_argument(
+        "--normalize-backend",
+        choices=["processes", "threads"],
+        default="processes",
+        help="Worker pool used by --normalize (default: processes).",
     )
     p_comb.add_argument(
         "--schema",
@@ -121,15 +146,35 @@ def build_parser() -> argparse.ArgumentParser:
     p_comb.add_argument(
         "--chunksize",
         type=int,
-        default=200000,
-        help="Rows per chunk when streaming with pandas (default: 200k).",
+        default=1_000_000,
+        help="Rows per chunk when streaming with pandas (default: 1M).",
+    )
+    p_comb.add_argument(
+        "--chunk-bytes",
+        type=positive_int,
+        default=None,
+        help=(
+            "Target chunk size in bytes; overrides --chunksize using the average "
+            "row length of the first input. Also raises the Arrow read block size "
+            "when larger than its 8 MB default."
+        ),
+    )
+    p_comb.add_argument(
+        "--engine",
+        choices=["auto", "arrow", "pandas"],
+        default="auto",
+        help=(
+            "Parsing/writing backend: 'arrow' streams with pyarrow.csv end-to-end, "
+            "'pandas' uses pandas, 'auto' picks arrow when pyarrow is installed and its "
+            "output matches pandas byte-for-byte (default)."
+        ),
     )
     p_comb.add_argument(
         "-T",
         "--threads",
-        type=int,
+        type=positive_int,
         default=4,
-        help="Threads to use for normalization step (default: 4).",
+        help="Threads to use for probing inputs and normalization (default: 4).",
     )
 
     p_comb.add_argument(
@@ -3,14 +3,19 @@
 from __future__ import annotations
 
 import csv
+import io
+import os
 import sys
 import glob as globlib
 import tempfile
 import shutil
+from collections import Counter
+from itertools import chain, islice
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor
-from typing import Dict, List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 try:
@@ -18,6 +23,12 @@ try:
 except Exception:
     tqdm = None
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except Exception:
+    pa = None
+
 SUPPORTED_DELIMS = {
     "comma": ",",
     "tab": "\t",          # fixed: real tab, not space
@@ -27,6 +38,9 @@ SUPPORTED_DELIMS = {
 
 SNIFF_CANDIDATES = [",", "\t", ";", "|"]
 
+ARROW_BLOCK_SIZE = 8 << 20
+OUT_BUFFER_SIZE = 1 << 20
+
 
 def eprint(*args, **kwargs):
     print(*args, file=sys.stderr, **kwargs)
@@ -40,7 +54,9 @@ def collect_paths(
     input_files: Optional[list[str]],
 ) -> list[Path]:
     if directory:
-        paths = [p for p in Path(directory).iterdir() if p.is_file()]
+        # DirEntry caches the file type, avoiding a stat per entry
+        with os.scandir(directory) as it:
+            paths = [Path(e.path) for e in it if e.is_file()]
     elif glob_patterns:
         paths: list[Path] = []
         for entry in glob_patterns:
@@ -59,8 +75,16 @@ def collect_paths(
     if missing:
         raise FileNotFoundError(f"Missing files: {missing}")
 
-    # de-dup & sort
-    return sorted({p.resolve() for p in paths})
+    # de-dup & sort; abspath is a string op, resolve() stats every component
+    seen: set[str] = set()
+    out: list[Path] = []
+    for p in paths:
+        key = os.path.abspath(p)
+        if key not in seen:
+            seen.add(key)
+            out.append(Path(key))
+    out.sort()
+    return out
 
 
 def ensure_single_extension(paths: list[Path], user_ext: Optional[str]) -> str:
@@ -79,36 +103,41 @@ def ensure_single_extension(paths: list[Path], user_ext: Optional[str]) -> str:
 #---- Delimiter, schema helpers ----
 
 def read_head_lines(path: Path, n: int) -> list[str]:
-    lines: list[str] = []
     with path.open("r", newline="", encoding="utf-8", errors="ignore") as fh:
-        for _ in range(n):
-            line = fh.readline()
-            if not line:
-                break
-            lines.append(line)
-    return lines
+        return list(islice(fh, n))
 
 
 def sniff_delimiter_from_lines(lines: list[str]) -> str:
     best_delim = None
     best_score = (-1, -1)
-    from collections import Counter
 
-    for delim in SNIFF_CANDIDATES:
-        counts = []
-        for ln in lines:
-            ln = ln.strip()
-            if not ln:
+    stripped = [ln.strip() for ln in lines]
+    stripped = [ln for ln in stripped if ln]
+
+    if stripped:
+        # Single pass over the sample bytes: tally each candidate per line.
+        # UTF-8 never reuses ASCII bytes inside multi-byte characters.
+        buf = np.frombuffer("\n".join(stripped).encode("utf-8"), dtype=np.uint8)
+        line_ids = np.cumsum(buf == ord("\n"))
+        counts = np.zeros((len(stripped), len(SNIFF_CANDIDATES)), dtype=np.int32)
+        for j, delim in enumerate(SNIFF_CANDIDATES):
+            counts[:, j] = np.bincount(line_ids[buf == ord(delim)], minlength=len(stripped))
+
+        # Well-formed files: some candidate appears equally often on every
+        # line. It has the highest possible mode_count, so skip the Counters.
+        unanimous = (counts == counts[0]).all(axis=0) & (counts[0] > 0)
+        if unanimous.any():
+            return SNIFF_CANDIDATES[int(np.argmax(np.where(unanimous, counts[0], -1)))]
+
+        for j, delim in enumerate(SNIFF_CANDIDATES):
+            mode_val, mode_count = Counter(counts[:, j].tolist()).most_common(1)[0]
+            # A candidate absent from most lines is trivially "consistent"
+            if mode_val == 0:
                 continue
-            counts.append(len(ln.split(delim)))
-        if not counts:
-            continue
-        c = Counter(counts)
-        mode_val, mode_count = c.most_common(1)[0]
-        score = (mode_count, mode_val)
-        if score > best_score:
-            best_score = score
-            best_delim = delim
+            score = (mode_count, mode_val)
+            if score > best_score:
+                best_score = score
+                best_delim = delim
 
     if best_delim is None:
         sample = "\n".join(lines)
@@ -120,18 +149,56 @@ def sniff_delimiter_from_lines(lines: list[str]) -> str:
     return best_delim
 
 
-def sniff_file_delimiter(path: Path, sample_rows: int) -> str:
-    lines = read_head_lines(path, sample_rows)
-    return sniff_delimiter_from_lines(lines)
+def peek_header_from_lines(lines: list[str], delim: str) -> list[str]:
+    for row in csv.reader(lines, delimiter=delim):
+        if row and any(cell.strip() for cell in row):
+            return [h.strip() for h in row]
+    return []
 
 
 def peek_header(path: Path, delim: str) -> list[str]:
     with path.open("r", encoding="utf-8", errors="ignore", newline="") as fh:
-        reader = csv.reader(fh, delimiter=delim)
-        for row in reader:
-            if row and any(cell.strip() for cell in row):
-                return [h.strip() for h in row]
-    return []
+        return peek_header_from_lines(fh, delim)
+
+
+def probe_file(path: Path, sample_rows: int) -> tuple[str, list[str]]:
+    """
+    Sniff the delimiter and parse the header from a single head read.
+    """
+    lines = read_head_lines(path, sample_rows)
+    delim = sniff_delimiter_from_lines(lines)
+    return delim, peek_header_from_lines(lines, delim)
+
+
+def translate_delimiter(src: Path, dst: Path, from_delim: str, to_delim: str) -> bool:
+    """
+    Swap single-byte delimiters with bytes.translate, skipping parsing entirely.
+    Returns False (leaving dst to be overwritten) as soon as a block holds a
+    quote or the target delimiter, since those cells need real CSV quoting.
+    """
+    if from_delim == to_delim:
+        shutil.copyfile(src, dst)
+        return True
+
+    from_b, to_b = from_delim.encode(), to_delim.encode()
+    if len(from_b) != 1 or len(to_b) != 1:
+        return False
+
+    table = bytes.maketrans(from_b, to_b)
+    with src.open("rb") as s, dst.open("wb") as d:
+        for block in iter(lambda: s.read(1 << 20), b""):
+            if b'"' in block or to_b in block:
+                return False
+            d.write(block.translate(table))
+    return True
+
+
+def estimate_row_bytes(path: Path, n: int = 100) -> float:
+    with path.open("rb") as fh:
+        lines = list(islice(fh, n))
+    if not lines:
+        return 1.0
+    return max(1.0, sum(len(ln) for ln in lines) / len(lines))
 
 
 def normalize_one(
@@ -140,52 +207,63 @@ def normalize_one(
     from_delim: str,
     to_delim: str,
     header: bool = True,
+    engine: str = "auto",
 ) -> Path:
     dst = target_dir / src.name
-    df_iter = pd.read_csv(
-        src,
-        sep=from_delim,
-        dtype=str,
-        chunksize=200_000,
-        engine="python",
-    )
-    mode = "w"
-    for idx, chunk in enumerate(df_iter):
-        chunk.to_csv(
-            dst,
-            index=False,
-            sep=to_delim,
-            header=(header and idx == 0),
-            mode=mode,
+    if header and translate_delimiter(src, dst, from_delim, to_delim):
+        return dst
+
+    with src.open("rb") as fh:
+        df_iter = pd.read_csv(
+            fh,
+            sep=from_delim,
+            dtype=str,
+            chunksize=200_000,
+            engine="c",
+            na_filter=False,
+            low_memory=True,
         )
-        mode = "a"
+        if engine != "pandas" and pa is not None:
+            # Arrow's C++ writer serializes string columns far faster than to_csv
+            with pa.OSFile(str(dst), "wb") as sink:
+                for idx, chunk in enumerate(df_iter):
+                    if header and idx == 0:
+                        sink.write(format_row(list(chunk.columns), to_delim).encode("utf-8"))
+                    # Explicit schema: an all-NaN object column would infer as null type
+                    batch = pa.RecordBatch.from_pandas(
+                        chunk,
+                        schema=pa.schema([(c, pa.string()) for c in chunk.columns]),
+                        preserve_index=False,
+                    )
+                    write_arrow_batch(sink, batch, to_delim)
+            return dst
+
+        with dst.open("w", buffering=OUT_BUFFER_SIZE, newline="", encoding="utf-8") as out:
+            for idx, chunk in enumerate(df_iter):
+                chunk.to_csv(
+                    out,
+                    index=False,
+                    sep=to_delim,
+                    header=(header and idx == 0),
+                )
     return dst
 
 
 def build_schema(headers_list: list[list[str]], policy: str) -> list[str]:
     if policy == "strict":
         base = headers_list[0]
-        base_set = set(base)
+        base_set = frozenset(base)
         for hdrs in headers_list[1:]:
-            if set(hdrs) != base_set:
+            if frozenset(hdrs) != base_set:
                 raise ValueError(
                     "Schema mismatch under --schema strict.\n"
                     f"Base: {base}\nOther: {hdrs}"
                 )
         return base
     elif policy == "union":
-        all_cols: list[str] = []
-        seen: set[str] = set()
-        for hdrs in headers_list:
-            for h in hdrs:
-                if h not in seen:
-                    seen.add(h)
-                    all_cols.append(h)
-        return all_cols
+        return list(dict.fromkeys(chain.from_iterable(headers_list)))
     elif policy == "intersection":
-        shared = set(headers_list[0])
-        for hdrs in headers_list[1:]:
-            shared &= set(hdrs)
+        shared = set.intersection(*map(set, headers_list))
         if not shared:
             raise ValueError("No shared columns under --schema intersection.")
         return [h for h in headers_list[0] if h in shared]
@@ -229,93 +307,321 @@ def source_value_for(path: Path, mode: str) -> str:
 
 #---- Core combination ----
 
-def combine_files(
+def format_row(cells: list[str], delim: str, lineterminator: str = "\n") -> str:
+    buf = io.StringIO()
+    csv.writer(buf, delimiter=delim, lineterminator=lineterminator).writerow(cells)
+    return buf.getvalue()
+
+
+def write_arrow_batch(sink, batch, delim: str) -> None:
+    # Arrow's "needed" style quotes every string, so write unquoted and only
+    # when a cell holds a delimiter/quote/newline (Arrow refuses those) fall
+    # back to the csv module for this batch; output then matches to_csv.
+    buf = io.BytesIO()
+    try:
+        pacsv.write_csv(
+            batch,
+            buf,
+            write_options=pacsv.WriteOptions(
+                include_header=False,
+                delimiter=delim,
+                quoting_style="none",
+            ),
+        )
+    except pa.ArrowInvalid:
+        text = io.StringIO()
+        writer = csv.writer(text, delimiter=delim, lineterminator="\n")
+        writer.writerows(zip(*(col.to_pylist() for col in batch.columns)))
+        sink.write(text.getvalue().encode("utf-8"))
+        return
+    sink.write(buf.getvalue())
+
+
+def combine_files_arrow(
     paths: list[Path],
     per_file_delim: dict[Path, str],
     schema_cols: list[str],
     out_path: Path,
     out_delim: str,
-    chunksize: int,
     write_header: bool,
     verbose: bool,
     columns_mode: bool,
-    per_file_header_maps: Optional[dict[Path, dict[str, str]]],
-    missing_policy: Optional[str],
+    per_file_read_cols: Optional[dict[Path, list[str]]],
     add_source_col: bool,
     source_col_name: str,
     source_mode: str,
+    chunksize: int,
+    block_size: Optional[int] = None,
     ) -> None:
-    mode = "w"
     total_rows = 0
 
     iterator = range(len(paths))
     progress = tqdm(iterator, desc="Combining files", unit="file") if tqdm else iterator
 
     out_cols = [source_col_name] + schema_cols if add_source_col else list(schema_cols)
+    out_schema = pa.schema([(c, pa.string()) for c in out_cols])
 
-    for idx in progress:
-        p = paths[idx]
-        sep = per_file_delim[p]
-        if verbose:
-            eprint(f"[COMBINE] {p} (sep={repr(sep)})")
+    with out_path.open("wb", buffering=OUT_BUFFER_SIZE) as sink:
+        if write_header:
+            sink.write(format_row(out_cols, out_delim).encode("utf-8"))
 
-        if columns_mode:
-            header_map = per_file_header_maps[p]  # type: ignore[index]
-            read_cols = [
-                header_map.get(
-                    (c.lower() if (c not in header_map and c.lower() in header_map) else c),
-                    c,
+        for idx in progress:
+            p = paths[idx]
+            sep = per_file_delim[p]
+            if verbose:
+                eprint(f"[COMBINE] {p} (sep={repr(sep)}, engine=arrow)")
+
+            if columns_mode:
+                read_cols = per_file_read_cols[p]  # type: ignore[index]
+            else:
+                read_cols = list(schema_cols)
+
+            start = sink.tell()
+            file_rows = 0
+            try:
+                # include_columns pushes the projection into the parser; columns
+                # absent from this file come back as all-null string columns.
+                reader = pacsv.open_csv(
+                    p,
+                    read_options=pacsv.ReadOptions(
+                        use_threads=True,
+                        block_size=(block_size or ARROW_BLOCK_SIZE),
+                    ),
+                    parse_options=pacsv.ParseOptions(delimiter=sep),
+                    convert_options=pacsv.ConvertOptions(
+                        include_columns=read_cols,
+                        include_missing_columns=True,
+                        column_types={c: pa.string() for c in read_cols},
+                        strings_can_be_null=False,
+                    ),
                 )
-                for c in schema_cols
-            ]
-        else:
-            read_cols = None
+                source_val = source_value_for(p, source_mode)
+
+                for batch in reader:
+                    arrays = batch.columns
+                    if add_source_col:
+                        arrays = [pa.array([source_val] * len(batch), pa.string())] + arrays
+                    out_batch = pa.RecordBatch.from_arrays(arrays, schema=out_schema)
+                    write_arrow_batch(sink, out_batch, out_delim)
+                    file_rows += len(out_batch)
+            except pa.ArrowInvalid as exc:
+                # Arrow rejects ragged rows that pandas pads; discard this
+                # file's partial output and re-read it with pandas
+                if verbose:
+                    eprint(f"[COMBINE] {p}: arrow parse failed ({exc}); re-reading with pandas")
+                sink.seek(start)
+                sink.truncate()
+                file_rows = 0
+                frames = iter_file_frames(
+                    p,
+                    sep=sep,
+                    schema_cols=schema_cols,
+                    out_cols=out_cols,
+                    chunksize=chunksize,
+                    columns_mode=columns_mode,
+                    read_cols=(read_cols if columns_mode else None),
+                    add_source_col=add_source_col,
+                    source_col_name=source_col_name,
+                    source_mode=source_mode,
+                )
+                for df in frames:
+                    sink.write(
+                        df.to_csv(sep=out_delim, index=False, header=False).encode("utf-8")
+                    )
+                    file_rows += len(df)
+            total_rows += file_rows
+
+    if verbose:
+        eprint(f"[COMBINE] Wrote {total_rows} rows to {out_path}")
+
+
+def header_line_ending(path: Path) -> bytes:
+    """
+    Terminator of the header line (first non-blank line, as in peek_header).
+    """
+    with path.open("rb") as fh:
+        for line in fh:
+            if line.strip():
+                body = line.rstrip(b"\r\n")
+                return line[len(body):]
+    return b""
+
+
+def copy_passthrough(
+    paths: list[Path],
+    schema_cols: list[str],
+    out_path: Path,
+    out_delim: str,
+    write_header: bool,
+    verbose: bool,
+    ) -> None:
+    """
+    Byte-level concatenation for inputs that already match the output
+    delimiter and column order: skip each file's header and copy the rest.
+    Bodies are copied verbatim; run only takes this path when every header
+    line already ends with os.linesep, the terminator the parsing paths write.
+    """
+    iterator = range(len(paths))
+    progress = tqdm(iterator, desc="Combining files", unit="file") if tqdm else iterator
+
+    line_end = os.linesep.encode()
+
+    with out_path.open("wb") as dst:
+        if write_header:
+            dst.write(format_row(schema_cols, out_delim, line_end.decode()).encode("utf-8"))
+
+        for idx in progress:
+            p = paths[idx]
+            if verbose:
+                eprint(f"[COMBINE] {p} (byte copy)")
+            with p.open("rb") as src:
+                # Header is the first non-blank line, as in peek_header
+                for line in src:
+                    if line.strip():
+                        break
+                last = dst.tell()
+                shutil.copyfileobj(src, dst, length=1 << 20)
+                if dst.tell() > last:
+                    src.seek(-1, 2)
+                    if src.read(1) not in (b"\n", b"\r"):
+                        dst.write(line_end)
+
+    if verbose:
+        eprint(f"[COMBINE] Copied {len(paths)} files to {out_path}")
+
+
+def iter_file_frames(
+    p: Path,
+    sep: str,
+    schema_cols: list[str],
+    out_cols: list[str],
+    chunksize: int,
+    columns_mode: bool,
+    read_cols: Optional[list[str]],
+    add_source_col: bool,
+    source_col_name: str,
+    source_mode: str,
+    ) -> Iterator[pd.DataFrame]:
+    """
+    Yield output-ready chunks (schema columns, optional source column) for one file.
+    """
+    wanted = set(read_cols if columns_mode else schema_cols)  # type: ignore[arg-type]
 
+    with p.open("rb") as fh:
         reader = pd.read_csv(
-            p,
+            fh,
             sep=sep,
             dtype=str,
             chunksize=chunksize,
-            engine="python",
+            engine="c",
+            na_filter=False,
+            low_memory=True,
+            usecols=lambda c: c in wanted,
         )
 
+        # Column plan is invariant per file: work it out from the first chunk
+        renamed: Optional[list[str]] = None
+        missing: list[str] = []
+        need_reindex = False
+
         for chunk in reader:
-            if columns_mode:
-                present = [c for c in read_cols if c in chunk.columns]  # type: ignore[arg-type]
-                df = chunk[present].copy()
-                if missing_policy == "fillna":
-                    for outcol, filecol in zip(schema_cols, read_cols):  # type: ignore[arg-type]
-                        if filecol not in chunk.columns:
-                            df[outcol] = pd.NA
-                rename_map = {
-                    filecol: outcol
-                    for outcol, filecol in zip(schema_cols, read_cols)  # type: ignore[arg-type]
-                    if filecol in df.columns
-                }
-                df.rename(columns=rename_map, inplace=True)
-                for col in schema_cols:
-                    if col not in df.columns:
-                        df[col] = pd.NA
+            if renamed is None:
+                present = set(chunk.columns)
+                if columns_mode:
+                    file_to_out = dict(zip(read_cols, schema_cols))  # type: ignore[arg-type]
+                    missing = [o for o, f in zip(schema_cols, read_cols) if f not in present]  # type: ignore[arg-type]
+                else:
+                    file_to_out = {}
+                    missing = [c for c in schema_cols if c not in present]
+                renamed = [file_to_out.get(c, c) for c in chunk.columns]
+                need_reindex = renamed + missing != schema_cols
+
+            df = chunk
+            df.columns = renamed
+            for col in missing:
+                df[col] = pd.NA
+            if need_reindex:
                 df = df[schema_cols]
-            else:
-                for col in schema_cols:
-                    if col not in chunk.columns:
-                        chunk[col] = pd.NA
-                df = chunk[schema_cols]
 
             if add_source_col:
                 df.insert(0, source_col_name, source_value_for(p, source_mode))
                 df = df[out_cols]
 
-            df.to_csv(
-                out_path,
-                sep=out_delim,
-                index=False,
-                header=(write_header and total_rows == 0),
-                mode=mode,
+            yield df
+
+
+def combine_files(
+    paths: list[Path],
+    per_file_delim: dict[Path, str],
+    schema_cols: list[str],
+    out_path: Path,
+    out_delim: str,
+    chunksize: int,
+    write_header: bool,
+    verbose: bool,
+    columns_mode: bool,
+    per_file_read_cols: Optional[dict[Path, list[str]]],
+    add_source_col: bool,
+    source_col_name: str,
+    source_mode: str,
+    block_size: Optional[int] = None,
+    engine: str = "auto",
+    ) -> None:
+    # auto only switches to arrow where its output is byte-identical to
+    # to_csv's: Arrow always ends rows with "\n", pandas uses os.linesep
+    use_arrow = engine == "arrow" or (
+        engine == "auto" and pa is not None and os.linesep == "\n"
+    )
+    if use_arrow:
+        combine_files_arrow(
+            paths=paths,
+            per_file_delim=per_file_delim,
+            schema_cols=schema_cols,
+            out_path=out_path,
+            out_delim=out_delim,
+            write_header=write_header,
+            verbose=verbose,
+            columns_mode=columns_mode,
+            per_file_read_cols=per_file_read_cols,
+            add_source_col=add_source_col,
+            source_col_name=source_col_name,
+            source_mode=source_mode,
+            chunksize=chunksize,
+            block_size=block_size,
+        )
+        return
+
+    total_rows = 0
+
+    iterator = range(len(paths))
+    progress = tqdm(iterator, desc="Combining files", unit="file") if tqdm else iterator
+
+    out_cols = [source_col_name] + schema_cols if add_source_col else list(schema_cols)
+
+    first = write_header
+    with out_path.open("w", buffering=OUT_BUFFER_SIZE, newline="", encoding="utf-8") as fh:
+        for idx in progress:
+            p = paths[idx]
+            sep = per_file_delim[p]
+            if verbose:
+                eprint(f"[COMBINE] {p} (sep={repr(sep)})")
+
+            frames = iter_file_frames(
+                p,
+                sep=sep,
+                schema_cols=schema_cols,
+                out_cols=out_cols,
+                chunksize=chunksize,
+                columns_mode=columns_mode,
+                read_cols=(per_file_read_cols[p] if columns_mode else None),  # type: ignore[index]
+                add_source_col=add_source_col,
+                source_col_name=source_col_name,
+                source_mode=source_mode,
             )
-            mode = "a"
-            total_rows += len(df)
+            for df in frames:
+                df.to_csv(fh, sep=out_delim, index=False, header=first)
+                first = False
+                total_rows += len(df)
 
     if verbose:
         eprint(f"[COMBINE] Wrote {total_rows} rows to {out_path}")
@@ -331,6 +637,9 @@ def run(args) -> None:
     out_path = Path(args.out)
     out_sep = SUPPORTED_DELIMS[args.out_delim]
 
+    if args.engine == "arrow" and pa is None:
+        raise SystemExit("--engine arrow requires pyarrow: pip install \"concat-tool[arrow]\"")
+
     paths = collect_paths(args.directory, args.glob, args.input_files)
     if not paths:
         raise SystemExit("No input files found.")
@@ -345,20 +654,31 @@ def run(args) -> None:
         for p in paths:
             eprint(" -", p)
 
+    declared = SUPPORTED_DELIMS[args.delim] if args.delim else None
+    if declared and args.verbose:
+        eprint(f"[SNIFF] skipped (user-declared delim={repr(declared)})")
+
+    def _probe(p: Path) -> tuple[Path, str, list[str]]:
+        if declared:
+            return p, declared, peek_header(p, declared)
+        return (p, *probe_file(p, args.sample_rows))
+
     per_file_delim: dict[Path, str] = {}
     per_file_headers: dict[Path, list[str]] = {}
-    for p in paths:
-        delim = sniff_file_delimiter(p, args.sample_rows)
+    with ThreadPoolExecutor(max_workers=args.threads) as ex:
+        probes = list(ex.map(_probe, paths))
+    for p, delim, header in probes:
         per_file_delim[p] = delim
-        per_file_headers[p] = peek_header(p, delim)
+        per_file_headers[p] = header
         if args.verbose:
-            eprint(f"[SNIFF] {p.name}: delim={repr(delim)} | header={per_file_headers[p]}")
+            eprint(f"[SNIFF] {p.name}: delim={repr(delim)} | header={header}")
 
     delims = set(per_file_delim.values())
     tmp_workspace: Optional[Path] = None
 
     try:
-        # Normalization if needed
+        # Mixed delimiters are read per file; --normalize materializes
+        # converted copies first for users who want a uniform workspace
         if len(delims) > 1:
             if args.normalize:
                 target = SUPPORTED_DELIMS[args.normalize]
@@ -367,7 +687,10 @@ def run(args) -> None:
                 tmp_workspace = Path(tempfile.mkdtemp(prefix="concat_norm_"))
                 normalized: list[Path] = []
 
-                with ThreadPoolExecutor(max_workers=args.threads) as ex:
+                # normalize_one holds the GIL while parsing, so processes scale
+                # better; threads remain for platforms where spawning is costly
+                pool_cls = ProcessPoolExecutor if args.normalize_backend == "processes" else ThreadPoolExecutor
+                with pool_cls(max_workers=args.threads) as ex:
                     futures = [
                         ex.submit(
                             normalize_one,
@@ -376,6 +699,7 @@ def run(args) -> None:
                             from_delim=per_file_delim[p],
                             to_delim=target,
                             header=True,
+                            engine=args.engine,
                         )
                         for p in paths
                     ]
@@ -386,12 +710,8 @@ def run(args) -> None:
                 paths = sorted(normalized)
                 per_file_delim = {p: target for p in paths}
                 per_file_headers = {p: peek_header(p, target) for p in paths}
-            else:
-                opts = ", ".join(SUPPORTED_DELIMS.keys())
-                raise SystemExit(
-                    f"Inconsistent delimiters detected: {sorted(delims)}. "
-                    f"Use --normalize {{{opts}}} to convert."
-                )
+            elif args.verbose:
+                eprint(f"[DELIM] Mixed delimiters {sorted(delims)} -> reading each file with its own")
 
         # Validate headers
         if any(len(h) == 0 for h in per_file_headers.values()):
@@ -402,11 +722,11 @@ def run(args) -> None:
 
         # Column selection vs schema mode
         columns_mode = args.columns is not None and len(args.columns) > 0
-        per_file_header_maps: Optional[dict[Path, dict[str, str]]] = None
+        per_file_read_cols: Optional[dict[Path, list[str]]] = None
 
         if columns_mode:
             requested = args.columns
-            per_file_header_maps = {}
+            per_file_read_cols = {}
             usable_paths: list[Path] = []
             skipped: list[tuple[str, list[str]]] = []
 
@@ -424,7 +744,10 @@ def run(args) -> None:
                         continue
                     elif args.missing_policy == "fillna":
                         pass
-                per_file_header_maps[p] = hmap
+                # File-side name for each requested column (missing ones keep the request)
+                per_file_read_cols[p] = [
+                    hmap.get(r.lower() if args.case_insensitive else r, r) for r in requested
+                ]
                 usable_paths.append(p)
 
             if not usable_paths:
@@ -453,7 +776,11 @@ def run(args) -> None:
             eprint("[DRY-RUN] Summary:")
             eprint(f"  Files: {len(paths)}")
             eprint(f"  Extension: .{ext_norm}")
-            eprint(f"  Unified delimiter: {repr(next(iter(set(per_file_delim.values()))))}")
+            final_delims = sorted(set(per_file_delim.values()))
+            if len(final_delims) == 1:
+                eprint(f"  Unified delimiter: {repr(final_delims[0])}")
+            else:
+                eprint(f"  Mixed delimiters (read per file): {final_delims}")
             if columns_mode:
                 eprint(f"  Columns mode: {schema_cols}")
                 eprint(f"  Missing-policy: {args.missing_policy}")
@@ -470,22 +797,53 @@ def run(args) -> None:
 
         out_path.parent.mkdir(parents=True, exist_ok=True)
 
-        combine_files(
-            paths=paths,
-            per_file_delim=per_file_delim,
-            schema_cols=schema_cols,
-            out_path=out_path,
-            out_delim=out_sep,
-            chunksize=args.chunksize,
-            write_header=(not args.no_header),
-            verbose=args.verbose,
-            columns_mode=columns_mode,
-            per_file_header_maps=per_file_header_maps,
-            missing_policy=(args.missing_policy if columns_mode else None),
-            add_source_col=add_source_col,
-            source_col_name=source_col_name,
-            source_mode=source_mode,
+        chunksize = args.chunksize
+        if args.chunk_bytes:
+            row_bytes = estimate_row_bytes(paths[0])
+            chunksize = max(1, int(args.chunk_bytes / row_bytes))
+            if args.verbose:
+                eprint(
+                    f"[CHUNK] {args.chunk_bytes} bytes / ~{row_bytes:.0f} bytes per row "
+                    f"-> chunksize={chunksize}"
+                )
+
+        # Nothing to reshape: inputs can be copied byte-for-byte
+        fast_path = (not add_source_col) and all(
+            per_file_delim[p] == out_sep and per_file_headers[p] == schema_cols
+            for p in paths
         )
+        # Keep line endings identical to what the parsing paths would write
+        fast_path = fast_path and all(
+            header_line_ending(p) in (b"", os.linesep.encode()) for p in paths
+        )
+        if fast_path:
+            copy_passthrough(
+                paths=paths,
+                schema_cols=schema_cols,
+                out_path=out_path,
+                out_delim=out_sep,
+                write_header=(not args.no_header),
+                verbose=args.verbose,
+            )
+        else:
+            combine_files(
+                paths=paths,
+                per_file_delim=per_file_delim,
+                schema_cols=schema_cols,
+                out_path=out_path,
+                out_delim=out_sep,
+                chunksize=chunksize,
+                write_header=(not args.no_header),
+                verbose=args.verbose,
+                columns_mode=columns_mode,
+                per_file_read_cols=per_file_read_cols,
+                add_source_col=add_source_col,
+                source_col_name=source_col_name,
+                source_mode=source_mode,
+                # Small blocks make Arrow fail on rows that straddle them
+                block_size=max(args.chunk_bytes or 0, ARROW_BLOCK_SIZE),
+                engine=args.engine,
+            )
 
         eprint("[DONE] Combined successfully.")
     finally: